@@ -1,54 +1,273 @@
+import atexit
+import functools
+import hashlib
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 import mysql.connector
-from typing import List, Tuple, Dict, Optional
+from mysql.connector import pooling
+from typing import Any, List, Tuple, Dict, Optional, Set
 import error_handler
 
+# The query log is keyed on a fixed-size hash of the query text, so long texts are neither
+# truncated nor compared in full by the unique index
+CREATE_LOG_TABLE_QUERY = '''
+    CREATE TABLE IF NOT EXISTS popular_query (
+        log_id INT AUTO_INCREMENT PRIMARY KEY,
+        type_query VARCHAR(50) NOT NULL,
+        text_query TEXT NOT NULL,
+        query_hash BINARY(16) NOT NULL,
+        count INT DEFAULT 1,
+        query_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE INDEX unique_query (type_query, query_hash)
+    );
+'''
+# Upgrade of a popular_query table created with the former VARCHAR(50) text key. Each step
+# can be repeated, so an upgrade interrupted before the unique index exists is resumed on the next run.
+CHECK_LOG_HASH_INDEX_QUERY = (
+    "SHOW INDEX FROM popular_query WHERE Key_name = 'unique_query' AND Column_name = 'query_hash'"
+)
+CHECK_LOG_INDEX_QUERY = "SHOW INDEX FROM popular_query WHERE Key_name = 'unique_query'"
+CHECK_LOG_HASH_COLUMN_QUERY = "SHOW COLUMNS FROM popular_query LIKE 'query_hash'"
+DROP_LOG_INDEX_QUERY = "ALTER TABLE popular_query DROP INDEX unique_query"
+ADD_LOG_HASH_COLUMN_QUERY = '''
+    ALTER TABLE popular_query
+        MODIFY text_query TEXT NOT NULL,
+        ADD COLUMN query_hash BINARY(16) NULL AFTER text_query
+'''
+SELECT_LOG_ROWS_QUERY = "SELECT log_id, type_query, text_query, count FROM popular_query ORDER BY log_id"
+UPDATE_LOG_ROW_QUERY = "UPDATE popular_query SET query_hash = %s, count = %s WHERE log_id = %s"
+DELETE_LOG_ROW_QUERY = "DELETE FROM popular_query WHERE log_id = %s"
+ADD_LOG_UNIQUE_INDEX_QUERY = '''
+    ALTER TABLE popular_query
+        MODIFY query_hash BINARY(16) NOT NULL,
+        ADD UNIQUE INDEX unique_query (type_query, query_hash)
+'''
+# Existence check for a table of the current schema; the name is passed LIKE-escaped
+CHECK_TABLE_QUERY = "SHOW TABLES LIKE %s"
+# Extended upsert for buffered log entries; {values} is one "(%s, %s, %s, %s)" group per
+# distinct entry, whose count is the number of times it was logged since the last flush
+INSERT_LOG_QUERY = '''
+    INSERT INTO popular_query (type_query, text_query, query_hash, count)
+    VALUES {values}
+    ON DUPLICATE KEY UPDATE count = count + VALUES(count)
+'''
+LOG_BUFFER_LIMIT = 500  # number of buffered log entries that triggers a flush
+LOG_INSERT_BATCH_SIZE = 1000  # distinct entries per INSERT statement, well below the 65535 placeholder limit
+STATEMENT_CACHE_SIZE = 128  # prepared cursors kept per connection by execute_query
+
+# Connection pool shared by all DbMaster instances, created on first connection. The pool opens all
+# of its connections up front and the application pins a single DbMaster for the whole session,
+# so one connection keeps startup at a single handshake; raise it only for concurrent DbMasters.
+POOL_NAME = "sakila"
+POOL_SIZE = 1
+_POOL: Optional[pooling.MySQLConnectionPool] = None
+
+
+def _get_pool(host: str, user: str, password: str, database: str) -> pooling.MySQLConnectionPool:
+    """
+    Return the shared connection pool, creating it on first use.
+
+    Args:
+        host (str): The hostname or IP address of the MySQL server.
+        user (str): The username for the MySQL server.
+        password (str): The password for the MySQL server.
+        database (str): The name of the database to connect to.
+
+    Returns:
+        pooling.MySQLConnectionPool: The shared connection pool.
+    """
+    global _POOL
+    if _POOL is None:
+        _POOL = pooling.MySQLConnectionPool(
+            pool_name=POOL_NAME, pool_size=POOL_SIZE,
+            pool_reset_session=False,  # skip the session reset round-trip on every checkout
+            host=host, user=user, password=password, database=database,
+            autocommit=True,  # reads run without an open transaction; writes start one explicitly
+            use_pure=False  # decode rows with the C extension when it is available (HAVE_CEXT)
+        )
+    return _POOL
+
+
+def close_pool() -> None:
+    """
+    Close all idle connections of the shared connection pool.
+
+    Call this once at application exit, after every DbMaster has been closed.
+    """
+    global _POOL
+    if _POOL is not None:
+        _POOL._remove_connections()
+        _POOL = None
+
+
+class Row(tuple):
+    """
+    A query result row stored as a plain tuple, with read-only dictionary-style access by column name.
+
+    The column names are held once per result set by the subclass returned from `row_type`,
+    instead of once per row as with dictionary cursors.
+    """
+    __slots__ = ()
+    _columns: Dict[str, int] = {}
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return tuple.__getitem__(self, self._columns[key])
+        return tuple.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        index = self._columns.get(key)
+        return default if index is None else tuple.__getitem__(self, index)
+
+    def keys(self):
+        return self._columns.keys()
+
+    def items(self):
+        return zip(self._columns, self)
+
+
+@functools.lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+def row_type(column_names: Tuple[str, ...]) -> type:
+    """
+    Return the Row subclass for a result set with the given column names.
+
+    Args:
+        column_names (Tuple[str, ...]): The column names of the result set, in order.
+
+    Returns:
+        type: A Row subclass mapping each column name to its position.
+    """
+    columns = {name: index for index, name in enumerate(column_names)}
+    return type("Row", (Row,), {"__slots__": (), "_columns": columns})
+
+
+def query_hash(text_query: str) -> bytes:
+    """
+    Compute the 16-byte key of a query text for the popular_query table.
+
+    Whitespace and case are normalized first, so equivalent texts share one log record.
+
+    Args:
+        text_query (str): The query text to hash.
+
+    Returns:
+        bytes: The MD5 digest of the normalized text.
+    """
+    normalized = " ".join(text_query.split()).lower()
+    return hashlib.md5(normalized.encode("utf-8")).digest()
+
 
 class DbMaster:
     """
     A class to handle database operations with MySQL using mysql.connector.
     Includes robust error handling, validation, and proper resource management.
     """
+    __slots__ = ("_connection", "_meta_cursor", "_stmt_cache", "_known_tables",
+                 "_log_buffer", "_log_pending", "_log_table_ready", "_connect_future")
 
     def __init__(self, host: str, user: str, password: str, database: str):
         """
-        Initializes the DbMaster object and establishes the connection to the MySQL database.
+        Initializes the DbMaster object and starts acquiring a connection to the MySQL database
+        from the shared connection pool.
+
+        The connection is established on a background thread, so the caller (e.g. the GUI)
+        is not blocked by the handshake. Use `ready` to poll for completion; the first access
+        to `connection` waits for it.
 
         Args:
             host (str): The hostname or IP address of the MySQL server.
             user (str): The username for the MySQL server.
             password (str): The password for the MySQL server.
             database (str): The name of the database to connect to.
+        """
+        self._connection = None
+        self._meta_cursor = None  # plain tuple cursor for internal DDL and existence checks
+        self._stmt_cache: "OrderedDict[str, Any]" = OrderedDict()  # SQL text -> prepared cursor, LRU order
+        self._known_tables: Set[str] = set()  # tables confirmed to exist during this session
+        self._log_buffer: "Counter[Tuple[str, str]]" = Counter()  # pending popular_query entries and their counts
+        self._log_pending = 0  # entries logged since the last flush, duplicates included
+        self._log_table_ready = False  # popular_query verified to exist with the current schema
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._connect_future: Optional[Future] = executor.submit(self._connect, host, user, password, database)
+        executor.shutdown(wait=False)  # the submitted connection attempt still runs to completion
+
+        # Write buffered log entries even if the application exits without calling close()
+        atexit.register(self.flush_log)
+
+    def _connect(self, host: str, user: str, password: str, database: str) -> None:
+        """
+        Acquires the pooled connection, opens the long-lived internal cursor and prepares the query log table.
+        Runs on a background thread, so errors are raised to the thread that resolves `connection` instead of
+        being shown here.
 
         Raises:
             RuntimeError: If the connection to the database fails.
         """
-        self.connection = None
-        self.cursor = None
         try:
-            self.connection = mysql.connector.connect(
-                host=host, user=user, password=password, database=database, autocommit=False
-            )
-            if not self.connection.is_connected():
+            self._connection = _get_pool(host, user, password, database).get_connection()
+            if not self._connection.is_connected():
                 raise RuntimeError("Failed to establish a database connection.")
-            self.cursor = self.connection.cursor(dictionary=True)
+            self._meta_cursor = self._connection.cursor()
+            # Avoid gap locks for the explicit log transactions (idempotent, as pooled sessions are reused as-is)
+            self._meta_cursor.execute("SET SESSION transaction_isolation = 'READ-COMMITTED'")
         except mysql.connector.Error as e:
-            if self.connection and self.connection.is_connected():
-                self.connection.close()
-            self.connection = None
-            self.cursor = None
-            error_handler.handle_error_with_recommendation("Database Error", str(e))
+            if self._connection and self._connection.is_connected():
+                self._connection.close()
+            self._connection = None
+            self._meta_cursor = None
             raise RuntimeError(f"Error connecting to MySQL: {e}")
 
-    def execute_query(self, query: str, params: Optional[Tuple] = None) -> List[Dict]:
+        # Prepare the query log table once per connection, so logging needs no existence checks
+        try:
+            self._ensure_log_table()
+        except Exception:
+            pass  # not fatal for the connection; flush_log retries and reports the error before writing
+
+    def ready(self) -> bool:
+        """
+        Tells whether the background connection attempt has finished (successfully or not).
+
+        Returns:
+            bool: True if `connection` can be accessed without blocking.
+        """
+        return self._connect_future is None or self._connect_future.done()
+
+    @property
+    def connection(self):
+        """
+        The pooled MySQL connection, or None if connecting failed or the connection was closed.
+
+        The first access waits for the background connection attempt and reports a failure.
+
+        Raises:
+            RuntimeError: On the first access, if the connection to the database failed.
+        """
+        if self._connect_future is not None:
+            future, self._connect_future = self._connect_future, None
+            try:
+                future.result()
+            except RuntimeError as e:
+                error_handler.handle_error_with_recommendation("Database Error", str(e))
+                raise
+            except Exception as e:  # e.g. a mysql.connector.Error raised while closing a failed connection
+                error_handler.handle_error_with_recommendation("Database Error", str(e))
+                raise RuntimeError(f"Error connecting to MySQL: {e}") from e
+        return self._connection
+
+    def execute_query(self, query: str, params: Optional[Tuple] = None) -> List[Row]:
         """
         Executes an SQL query and fetches the result.
 
+        Each distinct query text is prepared once on the server and its cursor is kept
+        in a per-connection LRU cache, so repeated queries skip parsing and planning.
+
         Args:
             query (str): The SQL query to execute.
             params (Optional[Tuple]): The tuple of parameters to safely insert into the query.
 
         Returns:
-            List[Dict]: A list of dictionaries containing the query results.
+            List[Row]: The query results; each row supports access by column name.
 
         Raises:
             RuntimeError: If no database connection is available or if an error occurs while executing the query.
@@ -59,73 +278,178 @@ class DbMaster:
         if params and not isinstance(params, tuple):
             raise ValueError("Params must be a tuple.")
         try:
-            self.cursor.execute(query, params)
-            return self.cursor.fetchall()
+            cursor = self._get_prepared_cursor(query)
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            row_class = row_type(tuple(cursor.column_names))
+            return [row_class(row) for row in rows]
         except mysql.connector.Error as e:
             #error_handler.handle_error_with_recommendation("Database Error", str(e))
             raise RuntimeError(f"Error executing query: {e}")
 
+    def _get_prepared_cursor(self, query: str):
+        """
+        Returns the prepared cursor for a query text, creating it on a cache miss.
+
+        The least recently used cursor is closed once more than `STATEMENT_CACHE_SIZE`
+        cursors are cached.
+
+        Args:
+            query (str): The SQL query text.
+
+        Returns:
+            MySQLCursorPrepared: The prepared cursor for the query.
+        """
+        cursor = self._stmt_cache.get(query)
+        if cursor is not None:
+            self._stmt_cache.move_to_end(query)
+            return cursor
+        cursor = self.connection.cursor(prepared=True)
+        self._stmt_cache[query] = cursor
+        if len(self._stmt_cache) > STATEMENT_CACHE_SIZE:
+            _, evicted = self._stmt_cache.popitem(last=False)
+            evicted.close()
+        return cursor
+
     def insert_query_log(self, type_query: str, text_query: str) -> None:
         """
-        Inserts or updates a log entry in the "popular_query" database table
+        Queues a log entry for the "popular_query" database table.
 
-        Based on the provided type  of query and text query.
-        If there is no entry matching the provided type and text query, a new
-        record is created. If an entry already exists, the `count` field is incremented by 1.
-        Ensures the table exists before attempting the operation.
-        Commits changes to the database or rolls back in case of an error.
+        Entries are buffered in memory and written in a single batch by `flush_log`
+        once `LOG_BUFFER_LIMIT` entries have accumulated, when the connection is closed,
+        or at interpreter exit.
+        Repeated entries are merged in the buffer and sent as one row carrying their count.
+        For each entry, if there is no record matching the type and text query a new
+        record is created, otherwise the `count` field is incremented accordingly.
+        Queuing needs no round-trip; the connection is only checked by `flush_log`.
 
         Args:
             type_query:str a string representing the specific type of query to be logged.
             text_query:str a string representing the textual content of the query to be logged.
         Returns:
-            This function does not return any value. It modifies the database state directly.
+            This function does not return any value.
+        Raises:
+            RuntimeError: If flushing the buffer fails.
+        """
+        self._log_buffer[(type_query, text_query)] += 1
+        self._log_pending += 1
+        if self._log_pending >= LOG_BUFFER_LIMIT:
+            self.flush_log()
+
+    def flush_log(self) -> None:
+        """
+        Writes all buffered log entries to the "popular_query" database table.
+
+        Sends the buffered entries as multi-row INSERT statements (one per
+        `LOG_INSERT_BATCH_SIZE` entries) and commits them in one transaction.
+        Rolls back in case of an error.
+
         Raises:
             RuntimeError: If there is no active database connection, if creation of the
             "popular_query" table fails, or if an issue occurs during the insertion or
             update of the query log.
         """
+        if not self._log_buffer:
+            return
         if not self.connection or not self.connection.is_connected():
             raise RuntimeError("No database connection.")
 
-        # Ensure the table exists
-        if not self.check_db_table("popular_query"):
-            create_table_query = '''
-                CREATE TABLE IF NOT EXISTS popular_query (
-                    log_id INT AUTO_INCREMENT PRIMARY KEY,
-                    type_query VARCHAR(50) NOT NULL,
-                    text_query VARCHAR(50) NOT NULL,
-                    count INT DEFAULT 1,
-                    query_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE INDEX unique_query (type_query, text_query)
-                );
-            '''
+        # Normally done by _connect; retried here if it failed at connection time
+        if not self._log_table_ready:
             try:
-                self.cursor.execute(create_table_query)
-                self.connection.commit()
-            except mysql.connector.Error as e:
-                self.connection.rollback()
+                self._ensure_log_table()
+            except RuntimeError as e:
                 error_handler.handle_error_with_recommendation("Database Error", str(e))
-                raise RuntimeError(f"Error creating 'popular_query' table: {e}")
-
-        # Insert or update query log
-        insert_query = '''
-            INSERT INTO popular_query (type_query, text_query)
-            VALUES (%s, %s)
-            ON DUPLICATE KEY UPDATE count = count + 1
-        '''
+                raise
+
+        # Insert or update all buffered entries, one extended INSERT per batch
+        entries = [(type_query, text_query, query_hash(text_query), count)
+                   for (type_query, text_query), count in self._log_buffer.items()]
         try:
-            self.cursor.execute(insert_query, (type_query, text_query))
+            self.connection.start_transaction()
+            for start in range(0, len(entries), LOG_INSERT_BATCH_SIZE):
+                batch = entries[start:start + LOG_INSERT_BATCH_SIZE]
+                values = ", ".join(["(%s, %s, %s, %s)"] * len(batch))
+                self._meta_cursor.execute(INSERT_LOG_QUERY.format(values=values),
+                                          tuple(value for entry in batch for value in entry))
             self.connection.commit()
+            self._log_buffer.clear()
+            self._log_pending = 0
         except mysql.connector.Error as e:
             self.connection.rollback()
             error_handler.handle_error_with_recommendation("Database Error", str(e))
             raise RuntimeError(f"Error inserting query log: {e}")
 
+    def _ensure_log_table(self) -> None:
+        """
+        Creates the "popular_query" table, or upgrades it to the hashed-key schema.
+
+        Raises:
+            RuntimeError: If creating or upgrading the table fails.
+        """
+        try:
+            self._meta_cursor.execute(CREATE_LOG_TABLE_QUERY)
+            self._meta_cursor.execute(CHECK_LOG_HASH_INDEX_QUERY)
+            if not self._meta_cursor.fetchall():
+                self._upgrade_log_table()
+            self._known_tables.add("popular_query")
+            self._log_table_ready = True
+        except mysql.connector.Error as e:
+            try:
+                self._connection.rollback()
+            except mysql.connector.Error:
+                pass  # the connection is gone; the original error is reported below
+            raise RuntimeError(f"Error creating 'popular_query' table: {e}")
+
+    def _upgrade_log_table(self) -> None:
+        """
+        Upgrades a "popular_query" table with the former text key to the hashed-key schema.
+
+        The hashes are computed with `query_hash`, the same function used when logging, and rows
+        whose texts normalize to the same key are merged (counts summed) before the unique index
+        is added.
+
+        Raises:
+            mysql.connector.Error: If a statement of the upgrade fails.
+        """
+        self._meta_cursor.execute(CHECK_LOG_INDEX_QUERY)
+        if self._meta_cursor.fetchall():  # the former unique index on the text
+            self._meta_cursor.execute(DROP_LOG_INDEX_QUERY)
+        self._meta_cursor.execute(CHECK_LOG_HASH_COLUMN_QUERY)
+        if not self._meta_cursor.fetchall():
+            self._meta_cursor.execute(ADD_LOG_HASH_COLUMN_QUERY)
+
+        # Backfill the hashes and merge duplicates in one transaction (the ALTERs commit implicitly)
+        self._meta_cursor.execute(SELECT_LOG_ROWS_QUERY)
+        merged: Dict[Tuple[str, bytes], List[int]] = {}  # key -> [kept log_id, summed count]
+        duplicates: List[Tuple[int]] = []
+        for log_id, type_query, text_query, count in self._meta_cursor.fetchall():
+            key = (type_query, query_hash(text_query))
+            if key in merged:
+                merged[key][1] += count or 0
+                duplicates.append((log_id,))
+            else:
+                merged[key] = [log_id, count or 0]
+        try:
+            self._connection.start_transaction()
+            self._meta_cursor.executemany(UPDATE_LOG_ROW_QUERY, [(key[1], count, log_id)
+                                                                 for key, (log_id, count) in merged.items()])
+            if duplicates:
+                self._meta_cursor.executemany(DELETE_LOG_ROW_QUERY, duplicates)
+            self._connection.commit()
+        except mysql.connector.Error:
+            self._connection.rollback()
+            raise
+
+        self._meta_cursor.execute(ADD_LOG_UNIQUE_INDEX_QUERY)
+
     def check_db_table(self, table_name: str) -> bool:
         """
         Checks if a table with the given name exists in the current database.
 
+        Positive results are cached for the lifetime of the connection, since tables
+        are not dropped mid-session.
+
         Args:
             table_name (str): The name of the table to check.
 
@@ -135,32 +459,54 @@ class DbMaster:
         Raises:
             RuntimeError: If no database connection is available or if an error occurs during the query.
         """
-        query = '''
-            SELECT COUNT(*) AS table_exists
-            FROM information_schema.tables
-            WHERE table_schema = DATABASE() AND table_name = %s;
-        '''
+        if table_name in self._known_tables:
+            return True
+
+        if not self.connection or not self.connection.is_connected():
+            raise RuntimeError("No database connection.")
+
+        # SHOW TABLES LIKE only consults the current schema, unlike information_schema.tables
+        pattern = table_name.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
         try:
-            self.cursor.execute(query, (table_name,))
-            result = self.cursor.fetchone()
-            return bool(result and result.get("table_exists", 0))  # Safely handle result and key lookup
+            self._meta_cursor.execute(CHECK_TABLE_QUERY, (pattern,))
+            exists = bool(self._meta_cursor.fetchall())
+            if exists:
+                self._known_tables.add(table_name)
+            return exists
         except mysql.connector.Error as e:
             error_handler.handle_error_with_recommendation("Database Error", str(e))
             raise RuntimeError(f"Error checking table existence: {e}")
 
     def close(self) -> None:
         """
-        Closes the database connection and cursor if they are active.
+        Closes the cursors and releases the database connection back to the pool.
 
-        Ensures all active resources are properly released to avoid resource leaks.
+        Flushes any buffered query log entries first, then ensures all active
+        resources are properly released to avoid resource leaks.
         """
+        atexit.unregister(self.flush_log)
+        try:
+            connection = self.connection
+        except RuntimeError:
+            connection = None  # the failed connection attempt is already reported
+        try:
+            self.flush_log()
+        except RuntimeError:
+            pass  # flush errors are already reported by flush_log
+        for cursor in self._stmt_cache.values():
+            try:
+                cursor.close()
+            except Exception as e:
+                error_handler.handle_error_with_recommendation("Cursor Close Error", str(e))
+        self._stmt_cache.clear()
         try:
-            if self.cursor:
-                self.cursor.close()
+            if self._meta_cursor:
+                self._meta_cursor.close()
         except Exception as e:
             error_handler.handle_error_with_recommendation("Cursor Close Error", str(e))
         try:
-            if self.connection and self.connection.is_connected():
-                self.connection.close()
+            if connection and connection.is_connected():
+                connection.close()  # returns the connection to the pool
         except Exception as e:
             error_handler.handle_error_with_recommendation("Connection Close Error", str(e))
+        self._connection = None
@@ -1,9 +1,41 @@
+import sys
+import time
+import atexit
+import queue
 import logging
-from tkinter import messagebox
+import logging.handlers
 
-# setting up logging
-logging.basicConfig(filename='error_log.txt', level=logging.ERROR,
-                    format='%(asctime)s - %(levelname)s - %(message)s')
+# setting up logging: records are queued and written to the file by a background listener,
+# so error paths do not block on file I/O
+_file_handler = logging.FileHandler('error_log.txt')
+_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, _file_handler)
+logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
+logging.getLogger().setLevel(logging.ERROR)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # writes the remaining queued records
+
+DIALOG_MIN_INTERVAL = 2.0  # seconds between two recommendation dialogs; errors in between are only logged
+_last_dialog_time = float('-inf')
+
+RECOMMENDATIONS = {
+    "Database Error": "Please check your database connection settings and try again.",
+    "Unexpected Error": "Please restart the application and try again. If the problem persists, contact support."
+}
+
+def _get_messagebox():
+    """
+    Import tkinter.messagebox on first use, so non-GUI code paths do not load Tk.
+
+    Returns:
+        module: The tkinter.messagebox module, or None if tkinter is not available.
+    """
+    try:
+        from tkinter import messagebox
+    except ImportError:
+        return None
+    return messagebox
 
 def handle_error(error_type: str, error_message: str):
     """
@@ -14,20 +46,28 @@ def handle_error(error_type: str, error_message: str):
         error_message (str): The detailed error message.
     """
     detailed_message = f"{error_type} occurred: {error_message}"
-    messagebox.showerror("Error", detailed_message)
+    messagebox = _get_messagebox()
+    if messagebox:
+        messagebox.showerror("Error", detailed_message)
+    else:
+        print(detailed_message, file=sys.stderr)
     logging.error(detailed_message)
 
 def handle_non_blocking_error(error_type: str, error_message: str):
     """
     Handle and log a non-blocking error by showing an error message box with an option to continue.
     If the user chooses not to continue, raise a RuntimeError.
+    Without tkinter the error is printed to stderr and execution continues.
 
     Args:
         error_type (str): The type of error.
         error_message (str): The detailed error message.
     """
     detailed_message = f"{error_type} occurred: {error_message}\nDo you want to continue?"
-    if messagebox.askyesno("Error", detailed_message):
+    messagebox = _get_messagebox()
+    if messagebox is None:
+        print(detailed_message, file=sys.stderr)
+    if messagebox is None or messagebox.askyesno("Error", detailed_message):
         logging.warning(f"Non-blocking {detailed_message}")
     else:
         logging.error(f"Blocking {detailed_message}")
@@ -36,15 +76,20 @@ def handle_non_blocking_error(error_type: str, error_message: str):
 def handle_error_with_recommendation(error_type: str, error_message: str):
     """
     Handle and log an error by showing an error message box with recommendations and logging the error.
+    At most one message box is shown per DIALOG_MIN_INTERVAL seconds; errors in between are only logged.
 
     Args:
         error_type (str): The type of error.
         error_message (str): The detailed error message.
     """
-    recommendations = {
-        "Database Error": "Please check your database connection settings and try again.",
-        "Unexpected Error": "Please restart the application and try again. If the problem persists, contact support."
-    }
-    detailed_message = f"{error_type} occurred: {error_message}\n\nRecommendation: {recommendations.get(error_type, 'Please try again later.')}"
-    messagebox.showerror("Error", detailed_message)
+    detailed_message = f"{error_type} occurred: {error_message}\n\nRecommendation: {RECOMMENDATIONS.get(error_type, 'Please try again later.')}"
+    global _last_dialog_time
+    now = time.monotonic()
+    if now - _last_dialog_time >= DIALOG_MIN_INTERVAL:
+        _last_dialog_time = now
+        messagebox = _get_messagebox()
+        if messagebox:
+            messagebox.showerror("Error", detailed_message)
+        else:
+            print(detailed_message, file=sys.stderr)
     logging.error(detailed_message)
@@ -1,7 +1,8 @@
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
-from typing import List, Dict, Any
+from operator import itemgetter
+from typing import Callable, List, Dict, Any, Optional, Tuple
 
 #======================================== display_table ============================================================
 # Constants
@@ -11,15 +12,39 @@ DEFAULT_WINDOW_HEIGHT_PADDING = 150
 DEFAULT_WINDOW_WIDTH = 400
 DEFAULT_WINDOW_HEIGHT = 400
 TABLE_ROW_HEIGHT = 100  # Default row height for calculation
+VISIBLE_ROWS = 20  # Table height in rows
+INITIAL_ROWS = 2 * VISIBLE_ROWS  # Rows inserted before the table window is shown
+INSERT_CHUNK_SIZE = 500  # Rows appended per event-loop turn once the window is shown
+HORIZONTAL_SCROLL_UNITS = 20  # Units scrolled per Left/Right keypress
+WIDTH_SAMPLE_ROWS = 50  # Rows measured to size the columns
 
+_root: Optional[tk.Tk] = None  # Root window used by display_table, resolved on first use
 
-def display_table(data: List[Dict[str, Any]], window_title: str) -> Dict[str, Any]:
+
+def column_max_length(column_values: Tuple[str, ...]) -> int:
+    """
+    Return the length of the longest value of a table column.
+
+    Args:
+        column_values (Tuple[str, ...]): The display text of every value in the column.
+
+    Returns:
+        int: The length of the longest value, or 0 for an empty column.
+    """
+    return max(map(len, column_values), default=0)  # built-ins keep the loop in C
+
+
+def display_table(data: List[Dict[str, Any]], window_title: str,
+                  fetch_more: Optional[Callable[[int], List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
     """
     Display a table using tkinter Treeview.
 
     Args:
         data (List[Dict[str, Any]]): The data to be displayed in the table.
         window_title (str): The title of the table window.
+        fetch_more (Optional[Callable[[int], List[Dict[str, Any]]]]): If `data` is only the first page
+            of a result, returns the page starting at the given row offset (pages the size of `data`);
+            it is called whenever the table is scrolled to the last loaded row.
 
     Returns:
         Dict[str, Any]: The selected row from the table.
@@ -29,15 +54,25 @@ def display_table(data: List[Dict[str, Any]], window_title: str) -> Dict[str, An
         """
         Ensure a tkinter root window exists and return it.
 
+        The root is cached on the module, so tkinter's default root is only looked up
+        the first time or after the cached window was destroyed.
+
         Returns:
             tk.Tk: The root tkinter window.
         """
-        if not tk._default_root:
-            local_root = tk.Tk()
-            local_root.withdraw()
-        else:
-            local_root = tk._default_root
-        return local_root
+        global _root
+        try:
+            if _root is not None and _root.winfo_exists():
+                return _root
+        except tk.TclError:  # the cached root has been destroyed
+            pass
+
+        _root = tk._default_root
+        if _root is None:
+            _root = tk.Tk()
+            _root.withdraw()
+        get_screen_size(_root)  # cache the screen dimensions for later dialogs
+        return _root
 
     def create_table_window(ct_root: tk.Tk, title: str) -> tk.Toplevel:
         """
@@ -69,79 +104,180 @@ def display_table(data: List[Dict[str, Any]], window_title: str) -> Dict[str, An
         return list(columns_data[0].keys()) if columns_data else []
 
 
-    def setup_table(st_window: tk.Toplevel, st_data: List[Dict[str, Any]], st_column_names: List[str]) -> ttk.Treeview:
+    def get_row_values(rows_data: List[Dict[str, Any]], row_column_names: List[str]) -> List[Tuple[str, ...]]:
+        """
+        Extract the display text of every row once, in column order.
+
+        The same text tuples are used to measure the columns and to fill the table,
+        so each value is converted to a string only once.
+
+        Args:
+            rows_data (List[Dict[str, Any]]): The data to be displayed in the table.
+            row_column_names (List[str]): The names of the columns.
+
+        Returns:
+            List[Tuple[str, ...]]: One tuple of value strings per row.
+        """
+        if rows_data and isinstance(rows_data[0], tuple):
+            rows = rows_data  # dbmaster.Row results are already tuples in column order
+        elif len(row_column_names) == 1:
+            rows = [(row[row_column_names[0]],) for row in rows_data]
+        else:
+            rows = map(itemgetter(*row_column_names), rows_data)
+        return [tuple(map(str, row)) for row in rows]
+
+
+    def setup_table(st_window: tk.Toplevel, st_data: List[Tuple[str, ...]],
+                    st_column_names: List[str], st_fetch_more=None) -> Tuple[ttk.Treeview, int]:
         """
         Set up the Treeview table inside the window.
 
         Args:
             st_window (tk.Toplevel): The table window.
-            st_data (List[Dict[str, Any]]): The data to be displayed in the table.
+            st_data (List[Tuple[str, ...]]): The row values to be displayed in the table.
             st_column_names (List[str]): The names of the columns.
+            st_fetch_more: Loads further pages of rows (see display_table), or None.
 
         Returns:
-            ttk.Treeview: The configured Treeview table.
+            Tuple[ttk.Treeview, int]: The configured Treeview table and the total width of its columns in pixels.
         """
         frame = tk.Frame(st_window)
         frame.pack(expand=True, fill=tk.BOTH)
-        tree = ttk.Treeview(frame, columns=column_names, show='headings')
-        tree.grid(row=0, column=0, sticky='nsew')
+        tree = ttk.Treeview(frame, columns=column_names, show='headings', height=min(len(st_data), VISIBLE_ROWS))
 
         # Configure columns and add headings
-        setup_table_columns(tree, st_column_names, st_data)
+        table_width = setup_table_columns(tree, st_column_names, st_data)
 
-        # Add data rows to table
-        add_data_to_table(tree, st_data, st_column_names)
+        # Add data rows to table before it is managed by grid, so inserts cause no redraws
+        add_data_to_table(tree, st_data)
+        tree.grid(row=0, column=0, sticky='nsew')
 
-        # Add scrollbars
-        add_scrollbars(tree, frame)
+        # Add scrollbars, loading the next page when scrolled to the end
+        on_yview = setup_paging(tree, st_data, st_column_names, st_fetch_more) if st_fetch_more else None
+        add_scrollbars(tree, frame, on_yview)
 
-        return tree
+        return tree, table_width
 
 
-    def setup_table_columns(tree: ttk.Treeview, column_names: List[str], data: List[Dict[str, Any]]):
+    def setup_table_columns(tree: ttk.Treeview, column_names: List[str], data: List[Tuple[str, ...]]) -> int:
         """
         Set up columns for the Treeview with appropriate widths.
 
+        Widths are estimated from the header and the first WIDTH_SAMPLE_ROWS rows only;
+        longer values further down can still be read by scrolling horizontally.
+
         Args:
             tree (ttk.Treeview): The Treeview table.
             column_names (List[str]): The names of the columns.
-            data (List[Dict[str, Any]]): The data to determine column widths.
+            data (List[Tuple[str, ...]]): The row values to sample for column widths.
+
+        Returns:
+            int: The total width of all columns in pixels.
         """
-        for col in column_names:
-            max_length = max(len(str(row[col])) for row in data)
+        total_width = 0
+        # Transpose the sampled rows into columns once instead of looking up every row per column
+        for col, column_values in zip(column_names, zip(*data[:WIDTH_SAMPLE_ROWS])):
+            max_length = column_max_length(column_values)
             max_len_col = len(col) + 5
             column_width = max(max_len_col, max_length) * PIXEL_SCALE
 
             tree.heading(col, text=col)
             tree.column(col, width=column_width)
+            total_width += column_width
+
+        return total_width
+
+
+    def add_data_to_table(tree: ttk.Treeview, data: List[Tuple[str, ...]], start: int = 0):
+        """
+        Insert rows of data into the table, starting at row `start`.
+
+        Each row gets its index as item id, so rows can be addressed directly (e.g. '0' is the first row).
 
+        Only the first INITIAL_ROWS rows are inserted right away, so the window opens in time
+        independent of the result size; the remaining rows are appended in chunks of
+        INSERT_CHUNK_SIZE from the event loop while the window is already usable.
 
-    def add_data_to_table(tree: ttk.Treeview, data: List[Dict[str, Any]], column_names: List[str]):
+        Args:
+            tree (ttk.Treeview): The Treeview table.
+            data (List[Tuple[str, ...]]): The row values to be inserted.
+            start (int): The index of the first row to insert (default is 0).
+        """
+        # Call the Tcl command directly: tree.insert() re-formats its options on every row
+        tcl_call = tree.tk.call
+        tree_path = str(tree)
+
+        def insert_rows(start: int, stop: int):
+            for index, values in enumerate(data[start:stop], start):
+                tcl_call(tree_path, 'insert', '', tk.END, '-id', index, '-values', values)
+
+        def insert_next_chunk(start: int):
+            if start >= len(data) or not tree.winfo_exists():
+                return
+            insert_rows(start, start + INSERT_CHUNK_SIZE)
+            tree.after(1, insert_next_chunk, start + INSERT_CHUNK_SIZE)
+
+        insert_rows(start, start + INITIAL_ROWS)
+        tree.after(1, insert_next_chunk, start + INITIAL_ROWS)
+
+
+    def setup_paging(tree: ttk.Treeview, data: List[Tuple[str, ...]], column_names: List[str],
+                     fetch_more: Callable[[int], List[Dict[str, Any]]]) -> Callable[[float], None]:
         """
-        Insert rows of data into the table.
+        Create the vertical scroll callback that appends the next page of rows to the table.
+
+        A page is requested once the view reaches the last loaded row and all loaded rows are
+        inserted; a page shorter than the first one ends the paging.
 
         Args:
             tree (ttk.Treeview): The Treeview table.
-            data (List[Dict[str, Any]]): The data to be inserted.
+            data (List[Tuple[str, ...]]): The row values loaded so far; extended with every page.
             column_names (List[str]): The names of the columns.
+            fetch_more (Callable[[int], List[Dict[str, Any]]]): Returns the page at a row offset.
+
+        Returns:
+            Callable[[float], None]: Callback taking the bottom edge of the view (0.0 - 1.0).
         """
-        for row in data:
-            values = [row[col] for col in column_names]
-            tree.insert('', tk.END, values=values)
+        page_size = len(data)
+        state = {"loading": False, "exhausted": False}
+
+        def load_next_page():
+            if tree.winfo_exists():
+                rows = fetch_more(len(data))
+                state["exhausted"] = len(rows) < page_size
+                if rows:
+                    start = len(data)
+                    data.extend(get_row_values(rows, column_names))
+                    add_data_to_table(tree, data, start)
+            state["loading"] = False
+
+        def on_yview(last: float):
+            if state["loading"] or state["exhausted"] or last < 1.0 or not tree.exists(len(data) - 1):
+                return
+            state["loading"] = True
+            tree.after_idle(load_next_page)  # not from within Tk's scrollbar update
+
+        return on_yview
 
 
-    def add_scrollbars(tree: ttk.Treeview, frame: tk.Frame):
+    def add_scrollbars(tree: ttk.Treeview, frame: tk.Frame, on_yview: Optional[Callable[[float], None]] = None):
         """
         Add horizontal and vertical scrollbars to the Treeview.
 
         Args:
             tree (ttk.Treeview): The Treeview table.
             frame (tk.Frame): The frame containing the Treeview.
+            on_yview (Optional[Callable[[float], None]]): Called with the bottom edge of the view
+                (0.0 - 1.0) whenever the table scrolls vertically.
         """
         scrollbar_x = ttk.Scrollbar(frame, orient='horizontal', command=tree.xview)
         scrollbar_y = ttk.Scrollbar(frame, orient='vertical', command=tree.yview)
 
-        tree.configure(xscrollcommand=scrollbar_x.set, yscrollcommand=scrollbar_y.set)
+        def set_yview(first, last):
+            scrollbar_y.set(first, last)
+            on_yview(float(last))
+
+        tree.configure(xscrollcommand=scrollbar_x.set, yscrollcommand=set_yview if on_yview else scrollbar_y.set)
         scrollbar_x.grid(row=1, column=0, sticky='ew')
         scrollbar_y.grid(row=0, column=1, sticky='ns')
 
@@ -182,24 +318,21 @@ def display_table(data: List[Dict[str, Any]], window_title: str) -> Dict[str, An
         """
 
         def on_key(event):
-            children = tree.get_children()
-            if not children:
-                return
-
-            selected = tree.selection()
-            index = list(children).index(selected[0]) if selected else -1
-
-            # Vertical navigation (up and down)
-            if event.keysym in ('Up', 'w') and index > 0:
-                focus_row(tree, children[index])
-            elif event.keysym in ('Down', 's') and index < len(children) - 1:
-                focus_row(tree, children[index])
+            # Vertical navigation (up and down) via native sibling lookup, O(1) per keypress
+            if event.keysym in ('Up', 'w', 'Down', 's'):
+                selected = tree.selection()
+                if selected:
+                    current = selected[0]
+                    adjacent = tree.prev(current) if event.keysym in ('Up', 'w') else tree.next(current)
+                    if adjacent:
+                        focus_row(tree, adjacent)
+                return 'break'  # the row is already moved, skip the default Treeview binding
 
             # Horizontal scrolling (left and right)
-            elif event.keysym in ('Left', 'a'):
-                tree.xview_scroll(-20, "units")  # may be "pages" left-right
+            if event.keysym in ('Left', 'a'):
+                tree.xview_scroll(-HORIZONTAL_SCROLL_UNITS, "units")  # may be "pages" left-right
             elif event.keysym in ('Right', 'd'):
-                tree.xview_scroll(20, "units")  # Scroll right by 20 units
+                tree.xview_scroll(HORIZONTAL_SCROLL_UNITS, "units")  # Scroll right
 
         # Binding events to keys
         tree.bind('<Up>', on_key)  # Move up
@@ -231,33 +364,27 @@ def display_table(data: List[Dict[str, Any]], window_title: str) -> Dict[str, An
                 data (List[Dict[str, Any]]): The data in the table.
             """
         if data:
-            if tree.get_children():  # Check if there is data
-                first_row = tree.get_children()[0]  # Get the ID of the first row
+            if tree.exists('0'):  # Check if there is data
+                first_row = '0'  # Item ids are row indexes (see add_data_to_table)
                 tree.focus(first_row)  # Set focus on the first row
                 tree.selection_set(first_row)  # Select the first row
                 tree.focus_set()  # Set focus on the Treeview for keyboard interaction
 
 
-    def adjust_window_size_and_center(window: tk.Toplevel, column_names: List[str], tree: ttk.Treeview,
-                                      root: tk.Tk) -> None:
+    def adjust_window_size_and_center(window: tk.Toplevel, table_width: int, root: tk.Tk) -> None:
 
         """
             Adjust window size based on content and center it on the screen.
 
             Args:
                 window (tk.Toplevel): The table window.
-                column_names (List[str]): The names of the columns.
-                tree (ttk.Treeview): The Treeview table.
+                table_width (int): The total width of the table columns in pixels.
                 root (tk.Tk): The root tkinter window.
             """
-        window_width = min(
-            sum(tree.column(col, option='width') for col in column_names),
-            root.winfo_screenwidth() - DEFAULT_WINDOW_WIDTH_PADDING
-        )
-        window_height = min(DEFAULT_WINDOW_HEIGHT, root.winfo_screenheight() - DEFAULT_WINDOW_HEIGHT_PADDING)
-
-        screen_width = root.winfo_screenwidth()
-        screen_height = root.winfo_screenheight()
+        screen_width, screen_height = get_screen_size(root)
+        window_width = min(table_width, screen_width - DEFAULT_WINDOW_WIDTH_PADDING)
+        window_height = min(DEFAULT_WINDOW_HEIGHT, screen_height - DEFAULT_WINDOW_HEIGHT_PADDING)
+
         position_right = int(screen_width / 2 - window_width / 2)
         position_down = int(screen_height / 2 - window_height / 2)
 
@@ -292,7 +419,8 @@ def display_table(data: List[Dict[str, Any]], window_title: str) -> Dict[str, An
 
     if column_names:
         # Create Treeview and set up the table
-        main_table = setup_table(window, data, column_names)
+        row_values = get_row_values(data, column_names)
+        main_table, table_width = setup_table(window, row_values, column_names, fetch_more)
 
         # Add selection logic
         setup_row_selection(main_table, window, column_names, selected_row)
@@ -304,7 +432,7 @@ def display_table(data: List[Dict[str, Any]], window_title: str) -> Dict[str, An
         auto_focus_first_row(main_table, data)
 
         # Resize and center the window
-        adjust_window_size_and_center(window, column_names, main_table, root)
+        adjust_window_size_and_center(window, table_width, root)
 
         # Set focus to Treeview
         window.after(100, lambda: main_table.focus_set())
@@ -318,26 +446,28 @@ def display_table(data: List[Dict[str, Any]], window_title: str) -> Dict[str, An
 #======================================== get_keyword ==================================================================
 # Constants
 WINDOW_WIDTH = 300
-WINDOW_HEIGHT = 250
+WINDOW_HEIGHT = 305
 
-def get_keyword(root, title, default_search_option="both"):
+def get_keyword(root, title, default_search_option="word_prefix"):
     """
     Prompt the user to enter a keyword and select search options.
 
     Args:
         root (tk.Tk): The root tkinter window.
         title (str): The title of the dialog window.
-        default_search_option (str): The default search option. Can be "title", "description", or "both".
+        default_search_option (str): The default search option. Can be "title", "starts_with", "description", "both"
+            (substring in title or description) or "word_prefix" (words in title or description starting with the keyword).
 
     Returns:
         dict: A dictionary containing the keyword and search options.
     """
 
     # Initial parameters
-    result = {"keyword": "", "title": False, "description": False, "both": True}
+    result = {"keyword": "", "title": False, "starts_with": False, "description": False, "both": False, "word_prefix": True}
 
-    # Create a child window
+    # Create a child window, hidden until all widgets are laid out (one layout pass, no flicker)
     dialog = tk.Toplevel(root)
+    dialog.withdraw()
     dialog.title(title)
     center_window(dialog, root, WINDOW_WIDTH, WINDOW_HEIGHT)
     dialog.resizable(False, False)
@@ -350,14 +480,15 @@ def get_keyword(root, title, default_search_option="both"):
     tk.Label(main_frame, text="Enter keyword:").grid(row=0, column=0, sticky="w", pady=(0, 5))  # Label
     keyword_entry = tk.Entry(main_frame, width=30)
     keyword_entry.grid(row=1, column=0, sticky="w", pady=(0, 15))  # Input field
-    keyword_entry.focus_set()
 
     # Radio buttons
     tk.Label(main_frame, text="Search in:").grid(row=2, column=0, sticky="w", pady=(0, 5))  # Label "Search in"
     search_option_var = tk.StringVar(value=default_search_option)
     tk.Radiobutton(main_frame, text="Title", variable=search_option_var, value="title").grid(row=3, column=0, sticky="w")
-    tk.Radiobutton(main_frame, text="Description", variable=search_option_var, value="description").grid(row=4, column=0, sticky="w")
-    tk.Radiobutton(main_frame, text="Both", variable=search_option_var, value="both").grid(row=5, column=0, sticky="w", pady=(0, 15))
+    tk.Radiobutton(main_frame, text="Title (starts with)", variable=search_option_var, value="starts_with").grid(row=4, column=0, sticky="w")
+    tk.Radiobutton(main_frame, text="Description", variable=search_option_var, value="description").grid(row=5, column=0, sticky="w")
+    tk.Radiobutton(main_frame, text="Both", variable=search_option_var, value="both").grid(row=6, column=0, sticky="w")
+    tk.Radiobutton(main_frame, text="Both (words starting with)", variable=search_option_var, value="word_prefix").grid(row=7, column=0, sticky="w", pady=(0, 15))
 
     # Action for the "Search" button
     def submit_action():
@@ -368,20 +499,24 @@ def get_keyword(root, title, default_search_option="both"):
         result.update({
             "keyword": keyword,
             "title": search_option_var.get() == "title",
+            "starts_with": search_option_var.get() == "starts_with",
             "description": search_option_var.get() == "description",
             "both": search_option_var.get() == "both",
+            "word_prefix": search_option_var.get() == "word_prefix",
         })
         dialog.destroy()  # Close the window if everything is OK
 
     # Submit button
-    tk.Button(main_frame, text="Search", command=submit_action).grid(row=6, column=0, sticky="s")
+    tk.Button(main_frame, text="Search", command=submit_action).grid(row=8, column=0, sticky="s")
 
     # Bind the Enter key
     dialog.bind('<Return>', lambda event: submit_action())
 
-    # Window settings for interaction
+    # Show the finished dialog and set window settings for interaction
+    dialog.deiconify()
     dialog.transient(root)
     dialog.grab_set()
+    keyword_entry.focus_set()
     root.wait_window(dialog)
 
     return result
@@ -395,8 +530,9 @@ def display_record(root: tk.Tk, record: Dict[str, str]) -> None:
         record (Dict[str, str]): A dictionary representing a database record.
     """
     padding = 30
-    max_width = root.winfo_screenwidth() - 400
-    max_height = root.winfo_screenheight() - 300
+    screen_width, screen_height = get_screen_size(root)
+    max_width = screen_width - 400
+    max_height = screen_height - 300
 
     # Create a child window
     dialog = tk.Toplevel(root)
@@ -418,6 +554,7 @@ def display_record(root: tk.Tk, record: Dict[str, str]) -> None:
 
     # Display the record fields and values
     row = 0
+    labels = []  # (key label, value label) per row, used to size the window
     for key, value in record.items():
         label_key = tk.Label(scrollable_frame, text=f"{key}:", anchor='w', justify='left')
         label_key.grid(row=row, column=0, sticky='w', padx=(0, padding))
@@ -432,6 +569,7 @@ def display_record(root: tk.Tk, record: Dict[str, str]) -> None:
                          column=1,
                          sticky='w'
                          )
+        labels.append((label_key, label_value))
 
         row += 1
 
@@ -452,10 +590,14 @@ def display_record(root: tk.Tk, record: Dict[str, str]) -> None:
                    sticky="s")
     dialog.bind('<Return>', close_window)
 
-    # Adjust window size based on content
-    dialog.update_idletasks()
-    content_height = scrollable_frame.winfo_reqheight() + 2 * padding
-    content_width = scrollable_frame.winfo_reqwidth() + 2 * padding + scrollbar.winfo_reqwidth()
+    # Adjust window size based on content. Labels and buttons request their size as soon as
+    # they are configured, so the grid size is summed up without a full update_idletasks() pass
+    grid_height = (sum(max(key.winfo_reqheight(), value.winfo_reqheight()) for key, value in labels)
+                   + ok_button.winfo_reqheight() + padding)
+    grid_width = (max((key.winfo_reqwidth() for key, _ in labels), default=0) + padding
+                  + max((value.winfo_reqwidth() for _, value in labels), default=0))
+    content_height = grid_height + 2 * padding
+    content_width = grid_width + 2 * padding + scrollbar.winfo_reqwidth()
 
     window_width = min(content_width, max_width)
     window_height = min(content_height, max_height)
@@ -486,8 +628,24 @@ def center_window(window, root, width, height):
         width (int): The width of the window.
         height (int): The height of the window.
     """
-    screen_width = root.winfo_screenwidth()
-    screen_height = root.winfo_screenheight()
+    screen_width, screen_height = get_screen_size(root)
     position_x = (screen_width // 2) - (width // 2)
     position_y = (screen_height // 2) - (height // 2)
-    window.geometry(f"{width}x{height}+{position_x}+{position_y}")
\ No newline at end of file
+    window.geometry(f"{width}x{height}+{position_x}+{position_y}")
+
+#======================================== get_screen_size ==================================================================
+def get_screen_size(root: tk.Misc) -> Tuple[int, int]:
+    """
+    Return the screen dimensions, querying the window system only once per root window.
+
+    Args:
+        root (tk.Misc): The root tkinter window.
+
+    Returns:
+        Tuple[int, int]: The screen width and height in pixels.
+    """
+    screen_size = getattr(root, '_cached_screen', None)
+    if screen_size is None:
+        screen_size = (root.winfo_screenwidth(), root.winfo_screenheight())
+        root._cached_screen = screen_size
+    return screen_size
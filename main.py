@@ -1,8 +1,12 @@
 import os
 import tkinter as tk
-from typing import Optional, Dict
+from functools import partial
+from types import MappingProxyType
+from typing import Callable, Optional, Dict, List, Mapping, Tuple
 from dotenv import load_dotenv
 from dbmaster import DbMaster
+from gui import center_window
+import query
 import utils
 
 # Load environment variables
@@ -17,27 +21,94 @@ DB_SETTINGS: Dict[str, Optional[str]] = {
 # Constants
 MAIN_WINDOW_WIDTH: int = 420
 MAIN_WINDOW_HEIGHT: int = 300
-ICON_PATHS: Dict[str, str] = {
+CONNECTION_POLL_INTERVAL_MS: int = 50  # How often the main window checks the background connection
+ICON_PATHS: Mapping[str, str] = MappingProxyType({
     "keyword": 'icons/menu_keyword.png',
     "category": 'icons/menu_category.png',
     "actor": 'icons/menu_actor.png',
     "popular": 'icons/menu_popular.png',
     "exit": 'icons/menu_exit.png',
-}
+})
+_ICON_ITEMS: Tuple[Tuple[str, str], ...] = tuple(ICON_PATHS.items())  # Materialized once for create_buttons
+_ICON_CACHE: Dict[str, tk.PhotoImage] = {}  # Loaded icons by path, shared by all windows
+
+
+def load_icon(path: str) -> tk.PhotoImage:
+    """
+    Load an icon image, reading and decoding each file only once.
+
+    Args:
+        path (str): The path of the icon file.
+
+    Returns:
+        tk.PhotoImage: The loaded icon.
+    """
+    icon = _ICON_CACHE.get(path)
+    if icon is None:
+        icon = _ICON_CACHE[path] = tk.PhotoImage(file=path)
+    return icon
+
+
+def initialize_database_connection() -> DbMaster:
+    """
+    Create the database connection object; the connection itself is established in the background.
+
+    Returns:
+        DbMaster: The database connection object.
+    """
+    return DbMaster(**DB_SETTINGS)  # type: ignore
 
 
-def initialize_database_connection() -> Optional[DbMaster]:
+def wait_for_database_connection(database_connection: DbMaster) -> bool:
     """
-    Create and return the database connection.
+    Wait until the background connection attempt has finished.
+
+    Args:
+        database_connection (DbMaster): The database connection object.
 
     Returns:
-        DbMaster: The database connection object or None if connection failed.
+        bool: True if the connection was established, False if it failed.
     """
     try:
-        return DbMaster(**DB_SETTINGS)  # type: ignore
-    except RuntimeError as error:
+        return database_connection.connection is not None
+    except Exception as error:  # any failure of the background attempt means no connection
         print(f"Database connection error: {error}")
-        return None
+        return False
+
+
+def enable_menu_when_connected(root: tk.Tk, frame: tk.Frame, database_connection: DbMaster,
+                               commands: List[Callable[[], None]]) -> None:
+    """
+    Enable the menu once the background connection attempt has finished.
+
+    Reschedules itself with root.after until the attempt is done, so the window stays
+    responsive while connecting. Closes the application if the connection failed.
+
+    Args:
+        root (tk.Tk): The main Tkinter window object.
+        frame (tk.Frame): The frame holding the menu buttons.
+        database_connection (DbMaster): The database connection object.
+        commands (List[Callable[[], None]]): The menu commands in menu order.
+    """
+    if not database_connection.ready():
+        root.after(CONNECTION_POLL_INTERVAL_MS, enable_menu_when_connected,
+                   root, frame, database_connection, commands)
+        return
+
+    if not wait_for_database_connection(database_connection):
+        print("Database connection failed. Exiting program.")
+        root.destroy()
+        return
+
+    for button in frame.winfo_children():
+        button.configure(state=tk.NORMAL)
+
+    # Bind keys 1-5 to the same actions as the buttons
+    for key, command in enumerate(commands, start=1):
+        root.bind(str(key), key_binding(command))
+
+    # Fetch the selection lists while the user is still choosing a menu
+    root.after_idle(query.prewarm_cache, database_connection)
 
 
 def setup_main_window() -> tk.Tk:
@@ -50,11 +121,7 @@ def setup_main_window() -> tk.Tk:
     root: tk.Tk = tk.Tk()
     root.title('SAKILA Database Search: MAKE YOUR CHOICE:')
     root.resizable(False, False)
-    screen_width: int = root.winfo_screenwidth()
-    screen_height: int = root.winfo_screenheight()
-    position_x: int = (screen_width // 2) - (MAIN_WINDOW_WIDTH // 2)
-    position_y: int = (screen_height // 2) - (MAIN_WINDOW_HEIGHT // 2)
-    root.geometry(f'{MAIN_WINDOW_WIDTH}x{MAIN_WINDOW_HEIGHT}+{position_x}+{position_y}')
+    center_window(root, root, MAIN_WINDOW_WIDTH, MAIN_WINDOW_HEIGHT)  # also caches the screen size for later dialogs
 
     # Ensure the window is active and gets the focus
     root.lift()  # Bring the window to the front
@@ -62,7 +129,22 @@ def setup_main_window() -> tk.Tk:
     return root
 
 
-def create_buttons(frame: tk.Frame, database_connection: DbMaster, root: tk.Tk) -> None:
+def key_binding(command: Callable[[], None]) -> Callable[[tk.Event], None]:
+    """
+    Adapt a menu command to a key binding callback, which also receives the event.
+
+    Args:
+        command (Callable[[], None]): The menu command.
+
+    Returns:
+        Callable[[tk.Event], None]: The callback for root.bind.
+    """
+    def on_key(event: tk.Event) -> None:
+        command()
+    return on_key
+
+
+def create_buttons(frame: tk.Frame, database_connection: DbMaster, root: tk.Tk) -> List[Callable[[], None]]:
     """
     Create and configure buttons with icons and their functionality.
 
@@ -70,20 +152,23 @@ def create_buttons(frame: tk.Frame, database_connection: DbMaster, root: tk.Tk)
         frame (tk.Frame): The parent frame where buttons will be placed.
         database_connection (DbMaster): The database connection object.
         root (tk.Tk): The main Tkinter window object.
+
+    Returns:
+        List[Callable[[], None]]: The button commands in menu order.
     """
     # Save icons as an attribute of the root to keep references
-    root.icons = {key: tk.PhotoImage(file=path) for key, path in ICON_PATHS.items()}
+    root.icons = {key: load_icon(path) for key, path in _ICON_ITEMS}
 
     # Configure grid layout in the parent frame
     frame.grid_rowconfigure(0, weight=1)  # Row growable - weight=1 makes the row and column "stretchy"
     frame.grid_columnconfigure(0, weight=1)  # Column growable
 
     buttons = [
-        ("  1. Search by KEYWORD", root.icons["keyword"], lambda: utils.search_by_keyword(database_connection, root)),
-        ("  2. Search by film CATEGORY & YEAR", root.icons["category"], lambda: utils.search_by_category_and_year(database_connection, root)),
-        ("  3. Search by ACTOR", root.icons["actor"], lambda: utils.search_by_actor(database_connection, root)),
-        ("  4. Show POPULAR QUERIES", root.icons["popular"], lambda: utils.show_popular_queries(database_connection)),
-        ("  5. EXIT", root.icons["exit"], lambda: utils.exit_program(database_connection, root)),
+        ("  1. Search by KEYWORD", root.icons["keyword"], partial(utils.search_by_keyword, database_connection, root)),
+        ("  2. Search by film CATEGORY & YEAR", root.icons["category"], partial(utils.search_by_category_and_year, database_connection, root)),
+        ("  3. Search by ACTOR", root.icons["actor"], partial(utils.search_by_actor, database_connection, root)),
+        ("  4. Show POPULAR QUERIES", root.icons["popular"], partial(utils.show_popular_queries, database_connection)),
+        ("  5. EXIT", root.icons["exit"], partial(utils.exit_program, database_connection, root)),
     ]
 
     for idx, (text, icon, command) in enumerate(buttons):
@@ -107,19 +192,18 @@ def create_buttons(frame: tk.Frame, database_connection: DbMaster, root: tk.Tk)
 
     # Add padding to center content better vertically
     frame.grid_rowconfigure(len(buttons), weight=1)
+    return [command for _, _, command in buttons]
 
 
 def main() -> None:
     """
     Main entry point for the application.
-    Initializes database connection, sets up the main window,
+    Starts the database connection, sets up the main window,
     creates buttons, and starts the Tkinter main loop.
+    The menu stays disabled until the connection is established.
     """
-    # Initialize database connection
-    database_connection: Optional[DbMaster] = initialize_database_connection()
-    if database_connection is None:
-        print("Database connection failed. Exiting program.")
-        return
+    # Start connecting to the database in the background
+    database_connection: DbMaster = initialize_database_connection()
 
     # Setup Tkinter root window
     root: tk.Tk = setup_main_window()
@@ -129,14 +213,12 @@ def main() -> None:
     frame.pack(expand=True, fill='both')  # Center the content
 
     # Create buttons
-    create_buttons(frame, database_connection, root)
-
-    # Bind keys to actions
-    root.bind('1', lambda event: utils.search_by_keyword(database_connection, root))
-    root.bind('2', lambda event: utils.search_by_category_and_year(database_connection))
-    root.bind('3', lambda event: utils.search_by_actor(database_connection))
-    root.bind('4', lambda event: utils.show_popular_queries(database_connection))
-    root.bind('5', lambda event: utils.exit_program(database_connection, root))
+    commands = create_buttons(frame, database_connection, root)
+    for button in frame.winfo_children():
+        button.configure(state=tk.DISABLED)
+
+    # Show the window right away and enable the menu once connected
+    root.after(0, enable_menu_when_connected, root, frame, database_connection, commands)
 
     # Run the Tkinter main loop
     root.mainloop()
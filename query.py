@@ -1,144 +1,220 @@
-from dbmaster import DbMaster
-from typing import Tuple, Optional, Dict, List
+from collections import OrderedDict
+from dbmaster import DbMaster, Row
+from types import MappingProxyType
+from functools import partial
+from typing import Callable, Mapping, Tuple, Optional, List
 import error_handler
 
-def create_sql_query(where_condition: str, order_condition: str) -> str:
+_EMPTY: Tuple = ()  # parameters of queries without placeholders
+
+POPULAR_QUERIES_LIMIT = 50  # entries shown by the popular queries view
+PAGE_SIZE = 100  # rows fetched per call of the paged (LIMIT/OFFSET) film queries
+FULLTEXT_MIN_TOKEN_SIZE = 3  # InnoDB default innodb_ft_min_token_size; shorter words are not indexed
+
+
+def fulltext_term(keyword: str) -> Optional[str]:
+    """
+    Build a boolean-mode FULLTEXT search term that matches words starting with the keyword.
+
+    Args:
+        keyword (str): The keyword entered by the user.
+
+    Returns:
+        Optional[str]: The search term, or None if the keyword can't be searched with the
+        FULLTEXT index (too short, several words or special characters); use "film_by_word_prefix" then.
+    """
+    if len(keyword) < FULLTEXT_MIN_TOKEN_SIZE or not keyword.isalnum():
+        return None
+    return f"+{keyword}*"
+
+
+def like_prefix(keyword: str) -> str:
+    """
+    Build a LIKE pattern matching values that start with the keyword; wildcards in the keyword match literally.
+
+    Args:
+        keyword (str): The keyword entered by the user.
+
+    Returns:
+        str: The LIKE pattern.
+    """
+    escaped = keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
+def create_sql_query(where_condition: str, order_condition: str, paged: bool = False, detailed: bool = False) -> str:
     """
     Create a full SQL query by inserting the given WHERE condition.
 
+    List queries select only the short film columns shown in result tables; the detailed
+    variant adds the description and the actor names, aggregated by a correlated subquery
+    for the selected film only.
+
     Args:
         where_condition (str): The condition to be used in the WHERE clause.
         order_condition (str): The condition to be used in the ORDER BY clause.
+        paged (bool): Whether to append a LIMIT %s OFFSET %s clause (two more parameters). Paged queries
+            are also ordered by the film_category key last, so rows tied on the order condition keep their page.
+        detailed (bool): Whether to select the description and actors of the films as well.
 
     Returns:
         str: The full SQL query.
     """
+    details = '''
+                    f.description as description,
+                    (SELECT GROUP_CONCAT(CONCAT(a.last_name, ' ', a.first_name) SEPARATOR ', ')
+                     FROM film_actor fa
+                        JOIN actor a ON fa.actor_id = a.actor_id
+                     WHERE fa.film_id = f.film_id) as actors,''' if detailed else ""
     query = f'''
             SELECT  f.film_id as fid,
                     f.title as title,
                     f.release_year as year,
-                    c.name as category,
-                    f.description as description,
-                    GROUP_CONCAT(CONCAT(a.last_name, ' ', a.first_name) SEPARATOR ', ') as actors,
+                    c.name as category,{details}
                     f.rental_rate as price,
                     f.length as length,
-                    f.rating as rating,
-                    CASE rating
-                        WHEN 'G' THEN 'General Audiences - All ages admitted'
-                        WHEN 'PG' THEN 'Parental Guidance Suggested - Some material may not be suitable for children'
-                        WHEN 'PG-13' THEN 'Parents Strongly Cautioned - Some material may be inappropriate for children under 13'
-                        WHEN 'R' THEN 'Restricted - Under 17 requires accompanying parent or adult guardian'
-                        WHEN 'NC-17' THEN 'Adults Only - No one 17 and under admitted'
-                        ELSE 'Not Rated'
-                    END as rating_description                                                        
-           FROM category c
-                LEFT JOIN film_category fc ON c.category_id = fc.category_id
-                LEFT JOIN film f ON fc.film_id = f.film_id
-                JOIN film_actor fa ON f.film_id = fa.film_id
-                JOIN actor a ON fa.actor_id = a.actor_id 
+                    f.rating as rating
+           FROM film f
+                JOIN film_category fc ON f.film_id = fc.film_id
+                JOIN category c ON fc.category_id = c.category_id
             WHERE {where_condition}
-            GROUP BY f.film_id, f.title, f.release_year, c.name, f.description, f.rental_rate, f.length, f.rating
-            ORDER BY  {order_condition};
+            ORDER BY  {order_condition}{", f.film_id, c.category_id" if paged else ""}
+            {"LIMIT %s OFFSET %s" if paged else ""};
             '''
     return query
 
 
-def get_info_from_db(db: DbMaster, menu: str, params: Optional[Tuple] = None) -> List[Dict]:
+# SQL text for every menu, built once at import instead of on every call; read-only
+_QUERIES: Mapping[str, str] = MappingProxyType({
+    # Categories (no parameters)
+    "category_list": '''
+        SELECT  category_id as Nr,
+                name as category
+        FROM category 
+        ORDER BY category_id;
+        ''',
+
+    # Movie years of all categories with their film counts (no parameters)
+    "category_year_pairs": '''
+        SELECT  c.name as category,
+                f.release_year as year,
+                COUNT(*) as films
+        FROM film f 
+            JOIN film_category fc ON f.film_id = fc.film_id
+            JOIN category c ON fc.category_id = c.category_id
+        GROUP BY c.name, f.release_year
+        ORDER BY category, year;
+        ''',
+
+    # List of actors (no parameters)
+    "actor_list": '''
+        SELECT  actor_id as FID,
+        last_name as LastName,
+        first_name as FirstName
+        FROM actor 
+        ORDER BY last_name;
+        ''',
+
+    # Movies by category and year (expects parameters: (category, year, limit, offset))
+    "film_by_category_and_year": create_sql_query("c.name = %s and f.release_year = %s", "title", paged=True),
+
+    # Movies by actor (expects parameters: (actor, limit, offset))
+    "film_by_actor": create_sql_query(
+        "f.film_id IN (SELECT film_id FROM film_actor WHERE actor_id = %s)", "year, title", paged=True),
+
+    # Movies by keyword in title and/or description
+    # (expects parameters: (title_keyword, description_keyword, limit, offset); None skips that column)
+    "film_by_keyword": create_sql_query(
+        "f.title LIKE CONCAT('%', %s, '%') or f.description LIKE CONCAT('%', %s, '%')", "year, title", paged=True),
+
+    # All details of one movie, for the record view (expects parameters: (film_id,))
+    "film_detail_by_id": create_sql_query("f.film_id = %s", "title", detailed=True),
+
+    # Movies whose title starts with a keyword; a range scan on the title index
+    # (expects parameters: (like_prefix(keyword), limit, offset))
+    "film_by_title_prefix": create_sql_query("f.title LIKE %s", "year, title", paged=True),
+
+    # Movies with a word in title or description starting with a keyword, without the FULLTEXT index
+    # (expects parameters: (like_prefix(keyword),) * 4 + (limit, offset))
+    "film_by_word_prefix": create_sql_query(
+        "f.title LIKE %s or f.title LIKE CONCAT('% ', %s) or "
+        "f.description LIKE %s or f.description LIKE CONCAT('% ', %s)", "year, title", paged=True),
+
+    # Movies by keyword in title and description via the FULLTEXT index of sakila.film_text
+    # (expects parameters: (fulltext_term, limit, offset))
+    "film_by_fulltext_both": create_sql_query(
+        "f.film_id IN (SELECT film_id FROM film_text WHERE MATCH(title, description) AGAINST (%s IN BOOLEAN MODE))",
+        "year, title", paged=True),
+
+    # Showed the most popular queries from sakila.popular_query - no parameters
+    "show_popular_queries": f'''
+    SELECT  type_query as 'Query type',
+            text_query as 'Query text',
+            count as 'Frequency'
+    FROM    sakila.popular_query
+    ORDER BY count DESC
+    LIMIT {POPULAR_QUERIES_LIMIT};
+    ''',
+})
+assert all(isinstance(sql, str) and sql for sql in _QUERIES.values()), "every menu needs SQL text"
+
+
+# Menus reading the film catalog, which the application never changes; results are kept
+# per (menu, params) for the session, the least recently used beyond LOOKUP_CACHE_SIZE are dropped
+CACHED_MENUS = frozenset({
+    "category_list", "category_year_pairs", "actor_list", "film_detail_by_id",
+    "film_by_category_and_year", "film_by_actor", "film_by_keyword", "film_by_title_prefix", "film_by_fulltext_both",
+    "film_by_word_prefix",
+})
+LOOKUP_CACHE_SIZE = 256
+_lookup_cache: "OrderedDict[Tuple[str, Optional[Tuple]], List[Row]]" = OrderedDict()
+
+
+def get_info_from_db(db: DbMaster, menu: str, params: Optional[Tuple] = None) -> List[Row]:
     """
     Retrieves information from the database based on the given 'menu' and 'params'.
 
+    Results of the menus in CACHED_MENUS are remembered, so reopening a list or repeating
+    a search needs no round-trip.
+
     Args:
         db (DbMaster): Database connection object.
-        menu (str): Query type (e.g., "category_list", "year_list").
+        menu (str): Query type (e.g., "category_list", "actor_list").
         params (Optional[Tuple]): Parameters for the SQL query (default is None).
 
     Returns:
-        List[Dict]: Results of the SQL query as a list of dictionaries.
+        List[Row]: Results of the SQL query; each row supports access by column name.
 
     Raises:
         ValueError: If the query parameters are invalid.
         RuntimeError: If an error occurs during SQL query execution.
     """
     # Validate the parameters
-    if params and not isinstance(params, tuple):
+    if params is not None and not isinstance(params, tuple):
         raise ValueError("Params should be a tuple or None.")
 
     if not menu:
         error_handler.handle_non_blocking_error("Invalid Input", "Menu cannot be empty or None.")
         return []
 
-    query = None
-
-    # Using match-case to handle different queries
-    match menu:
-        # Categories (no parameters)
-        case "category_list":
-            query = '''
-                SELECT  category_id as Nr,
-                        name as category
-                FROM category 
-                ORDER BY category_id;
-                '''
-
-        # Movie years for a category (expects parameters: (category,))
-        case "year_list":
-            query = '''
-                SELECT DISTINCT f.release_year as year
-                FROM film f 
-                    JOIN film_category fc ON f.film_id = fc.film_id
-                    JOIN category c ON fc.category_id = c.category_id
-                WHERE c.name = %s
-                ORDER BY year;
-                '''
-
-        # List of actors (no parameters)
-        case "actor_list":
-            query = '''
-                SELECT  actor_id as FID,
-                last_name as LastName,
-                first_name as FirstName
-                FROM actor 
-                ORDER BY last_name;
-                '''
-
-        # Movies by category and year (expects parameters: (category, year))
-        case "film_by_category_and_year":
-            query = create_sql_query("c.name = %s and f.release_year = %s","category, year")
-
-        # Movies by actor (expects parameters: (actor,))
-        case "film_by_actor":  # params: (actor,)
-            query = create_sql_query("fa.actor_id = %s","year, title")
-
-        # Movies by keyword in title and description (expects parameters: (keyword,keyword))
-        case "film_by_keyword_both":
-            query = create_sql_query("f.title LIKE %s or f.description LIKE %s", "year, title")
-
-        # Movies by keyword in title (expects parameters: (keyword,))
-        case "film_by_keyword_in_film_title":
-            query = create_sql_query("f.title LIKE %s", "year, title")
-
-        # Movies by keyword in description (expects parameters: (keyword,))
-        case "film_by_keyword_in_film_description":
-            query = create_sql_query("f.description LIKE %s", "year, title")
-
-        # Showed popular queries from sakila.popular_query - no parameters
-        case "show_popular_queries":
-            query = '''
-            SELECT  type_query as 'Query type',
-                    text_query as 'Query text',
-                    count as 'Frequency'
-            FROM    sakila.popular_query
-            ORDER BY count DESC;
-            '''
-        case _:
-            error_handler.handle_non_blocking_error("Invalid Query", f"Menu '{menu}' is not recognized.")
-            return []
+    query = _QUERIES.get(menu)
+    if query is None:
+        error_handler.handle_non_blocking_error("Invalid Query", f"Menu '{menu}' is not recognized.")
+        return []
+
+    cached = _lookup_cache.get((menu, params)) if menu in CACHED_MENUS else None
+    if cached is not None:
+        _lookup_cache.move_to_end((menu, params))
+        return cached
 
     # Executing the query and handling exceptions
     try:
-        if query and isinstance(query, str):
-            res = db.execute_query(query, params or ())
-            return res
+        res = db.execute_query(query, params if params is not None else _EMPTY)
+        if menu in CACHED_MENUS:
+            _lookup_cache[(menu, params)] = res
+            if len(_lookup_cache) > LOOKUP_CACHE_SIZE:
+                _lookup_cache.popitem(last=False)
+        return res
     except RuntimeError as e:
         error_handler.handle_error("Runtime Error", str(e))
     except ValueError as e:
@@ -147,3 +223,51 @@ def get_info_from_db(db: DbMaster, menu: str, params: Optional[Tuple] = None) ->
         error_handler.handle_error("Unexpected Error", str(e))
 
     return []
+
+
+def get_page_from_db(db: DbMaster, menu: str, params: Tuple, offset: int = 0) -> List[Row]:
+    """
+    Retrieves one page of at most PAGE_SIZE rows of a paged menu (see create_sql_query).
+
+    Args:
+        db (DbMaster): Database connection object.
+        menu (str): Query type of a paged query (e.g., "film_by_keyword").
+        params (Tuple): Parameters for the SQL query, without the LIMIT and OFFSET values.
+        offset (int): Number of rows to skip (default is 0, the first page).
+
+    Returns:
+        List[Row]: The rows of the page; fewer than PAGE_SIZE on the last page.
+    """
+    return get_info_from_db(db, menu, params + (PAGE_SIZE, offset))
+
+
+def page_loader(db: DbMaster, menu: str, params: Tuple,
+                first_page: List[Row]) -> Optional[Callable[[int], List[Row]]]:
+    """
+    Returns the loader of further pages for a paged result, for gui.display_table's `fetch_more`.
+
+    Args:
+        db (DbMaster): Database connection object.
+        menu (str): Query type of a paged query (e.g., "film_by_keyword").
+        params (Tuple): Parameters for the SQL query, without the LIMIT and OFFSET values.
+        first_page (List[Row]): The first page of the result.
+
+    Returns:
+        Optional[Callable[[int], List[Row]]]: Fetches the page at a row offset, or None if the
+        first page already holds the whole result.
+    """
+    if len(first_page) < PAGE_SIZE:
+        return None
+    return partial(get_page_from_db, db, menu, params)
+
+
+def prewarm_cache(db: DbMaster) -> None:
+    """
+    Loads the reference lists into the session cache, so the first category or actor search
+    needs no round-trip for its selection lists.
+
+    Args:
+        db (DbMaster): Database connection object.
+    """
+    for menu in ("category_list", "category_year_pairs", "actor_list"):
+        get_info_from_db(db, menu)
@@ -1,18 +1,51 @@
+import functools
 import tkinter as tk
 from tkinter import messagebox
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import gui
 import query
 import error_handler
-from dbmaster import DbMaster
+from dbmaster import DbMaster, close_pool
+
+# Explanations of the film ratings, added to a film record when it is displayed
+RATING_DESCRIPTIONS: Dict[str, str] = {
+    'G': 'General Audiences - All ages admitted',
+    'PG': 'Parental Guidance Suggested - Some material may not be suitable for children',
+    'PG-13': 'Parents Strongly Cautioned - Some material may be inappropriate for children under 13',
+    'R': 'Restricted - Under 17 requires accompanying parent or adult guardian',
+    'NC-17': 'Adults Only - No one 17 and under admitted',
+}
+NOT_RATED = 'Not Rated'
+MIN_KEYWORD_LENGTH = 2  # shorter keywords match nearly every film
+
+def safe_ui_action(action: Callable[..., None]) -> Callable[..., None]:
+    """
+    Decorator for menu actions: reports an unexpected exception in an error dialog
+    instead of letting it escape into the Tkinter event loop.
 
+    :param action: The menu action to wrap.
+    :type action: Callable[..., None]
+    :return: The wrapped menu action.
+    :rtype: Callable[..., None]
+    """
+    @functools.wraps(action)
+    def wrapper(*args: Any, **kwargs: Any) -> None:
+        try:
+            action(*args, **kwargs)
+        except Exception as e:
+            error_handler.handle_error_with_recommendation("Unexpected Error", str(e))
+    return wrapper
+
+@safe_ui_action
 def search_by_keyword(db: DbMaster, root: tk.Tk) -> None:
     """
     Search for films based on a keyword and display the results in a GUI table.
 
     The function first retrieves a keyword and related search options from the user via a dialog. Depending on
-    the selected search options, it queries the database for films either by their title, description, or both.
+    the selected search options, it queries the database for films either by their title, description, or both;
+    the default "words starting with" option matches word beginnings in both fields through the FULLTEXT index
+    instead of substrings.
     The results are displayed  in a table within a Tkinter GUI. Any selected movie can be further inspected in a
     detailed view. Additionally, successful queries are logged for future analysis. If no results are found,
     an error message is displayed to  the user.
@@ -25,48 +58,56 @@ def search_by_keyword(db: DbMaster, root: tk.Tk) -> None:
     :rtype: None
 
     """
-    try:
-        # Get keyword and search rules from the user
-        keyword_and_search_rules_dict: Optional[Dict[str, Any]] = gui.get_keyword(root, "Keyword to search")
-        if keyword_and_search_rules_dict:
-            # Extract the keyword
-            keyword = keyword_and_search_rules_dict.get('keyword')
-            if not keyword:
-                display_error("No keyword selected! Try again")
-                return
-
-            # Determine the search scope based on the provided options
-            if keyword_and_search_rules_dict.get('both'):
-                answer = query.get_info_from_db(
-                    db, "film_by_keyword_both", (f"%{keyword}%", f"%{keyword}%")
-                )
-            elif keyword_and_search_rules_dict.get('title'):
-                answer = query.get_info_from_db(
-                    db, "film_by_keyword_in_film_title", (f"%{keyword}%",)
-                )
-            elif keyword_and_search_rules_dict.get('description'):
-                answer = query.get_info_from_db(
-                    db, "film_by_keyword_in_film_description", (f"%{keyword}%",)
-                )
-            else:
-                answer = []
-
-            # Handle the search results
-            if answer:
-                movie = gui.display_table(
-                    answer, f"Films by keyword '{keyword}' | >> more Info: <Double-Click> or <Enter>"
-                )
-                if movie:
-                    gui.display_record(root, movie)
-                    # Log the query in the "popular_query" database
-                    db.insert_query_log('film_by_keyword', f'{keyword}')
-            else:
-                display_error(f"No Movie found matching the keyword: < {keyword} > !")
+    # Get keyword and search rules from the user
+    keyword_and_search_rules_dict: Optional[Dict[str, Any]] = gui.get_keyword(root, "Keyword to search")
+    if keyword_and_search_rules_dict:
+        # Extract the keyword
+        keyword = (keyword_and_search_rules_dict.get('keyword') or '').strip()
+        if not keyword:
+            display_error("No keyword selected! Try again")
+            return
+        if len(keyword) < MIN_KEYWORD_LENGTH:
+            display_error(f"The keyword needs at least {MIN_KEYWORD_LENGTH} characters! Try again")
+            return
 
-    except Exception as e:
-        error_handler.handle_error_with_recommendation("An unexpected error occurred:", str(e))
+        # Determine the search scope based on the provided options
+        menu, params = "film_by_keyword", None
+        if keyword_and_search_rules_dict.get('both'):
+            params = (keyword, keyword)
+        elif keyword_and_search_rules_dict.get('title'):
+            params = (keyword, None)
+        elif keyword_and_search_rules_dict.get('starts_with'):
+            menu, params = "film_by_title_prefix", (query.like_prefix(keyword),)
+        elif keyword_and_search_rules_dict.get('description'):
+            params = (None, keyword)
+        elif keyword_and_search_rules_dict.get('word_prefix'):
+            menu, params = "film_by_word_prefix", (query.like_prefix(keyword),) * 4
+
+        answer = []
+        term = query.fulltext_term(keyword) if keyword_and_search_rules_dict.get('word_prefix') else None
+        if term:
+            answer = query.get_page_from_db(db, "film_by_fulltext_both", (term,))
+            if answer:
+                menu, params = "film_by_fulltext_both", (term,)
+        # The same word-prefix match by LIKE for keywords the FULLTEXT index can't search or skips (stopwords)
+        if not answer and params:
+            answer = query.get_page_from_db(db, menu, params)
+
+        # Handle the search results (the first page; further pages are loaded while scrolling)
+        if answer:
+            movie = gui.display_table(
+                answer, f"Films by keyword '{keyword}' | >> more Info: <Double-Click> or <Enter>",
+                query.page_loader(db, menu, params, answer)
+            )
+            if movie:
+                display_film_record(db, root, movie)
+                # Log the query in the "popular_query" database
+                db.insert_query_log('film_by_keyword', f'{keyword}')
+        else:
+            display_error(f"No Movie found matching the keyword: < {keyword} > !")
 
 
+@safe_ui_action
 def search_by_category_and_year(db: DbMaster, root: tk.Tk) -> None:
     """
     Search for movies by category and year using GUI-based selection and database querying.
@@ -84,54 +125,59 @@ def search_by_category_and_year(db: DbMaster, root: tk.Tk) -> None:
     :return: This function does not return a value.
     :rtype: None
     """
-    try:
-        def select_category():
-            categories = query.get_info_from_db(db, "category_list")
-            if not categories:
-                display_error("No categories found!")
-                return None
-            selected = gui.display_table(categories, 'Choose a category:')
-            return selected.get('category') if selected else None
-
-
-        def select_year(category):
-            years = query.get_info_from_db(db, "year_list", (category,))
-            if not years:
-                display_error(f"No years found for category: {category}")
-                return None
-            selected = gui.display_table(years, 'Choose a year:')
-            return selected.get('year') if selected else None
-
-        # Choose category
-        category = select_category()
-        if not category:
-           display_error("No category selected! Try again")
-           return
-
-        # Choose year
-        year = select_year(category)
-        if not year:
+    def select_category():
+        categories = query.get_info_from_db(db, "category_list")
+        if not categories:
+            display_error("No categories found!")
+            return None
+        selected = gui.display_table(categories, 'Choose a category:')
+        if not selected:
+            display_error("No category selected! Try again")
+            return None
+        return selected.get('category')
+
+
+    def select_year(category):
+        # The years of all categories are fetched once per session, so no query per category
+        years = [{'year': pair['year'], 'films': pair['films']}
+                 for pair in query.get_info_from_db(db, "category_year_pairs")
+                 if pair['category'] == category]
+        if not years:
+            display_error(f"No years found for category: {category}")
+            return None
+        selected = gui.display_table(years, 'Choose a year:')
+        if not selected:
             display_error("No year selected! Try again")
-            return
+            return None
+        return selected.get('year')
 
-        # Search for movies
-        results = query.get_info_from_db(db, "film_by_category_and_year", (category, year))
-        if not results:
-            display_error(f"No movies found for category: {category} and year: {year}")
-            return
+    # Choose category and year; the helpers report why nothing was chosen
+    category = select_category()
+    if not category:
+        return
 
-        movie = gui.display_table(
-            results,
-            f"Films by category '{category}' and year '{year}' | >> more Info: <Double-Click> or <Enter>"
-        )
-        if movie:
-            gui.display_record(root, movie)
-            # Insert actor search information into the "popular_query" database
-            db.insert_query_log('film_by_category_and_year', f'{category},{year}')
-    except Exception as e:
-        error_handler.handle_error_with_recommendation("Unexpected Error", str(e))
+    year = select_year(category)
+    if not year:
+        return
 
+    # Search for movies (the first page; further pages are loaded while scrolling)
+    results = query.get_page_from_db(db, "film_by_category_and_year", (category, year))
+    if not results:
+        display_error(f"No movies found for category: {category} and year: {year}")
+        return
+
+    movie = gui.display_table(
+        results,
+        f"Films by category '{category}' and year '{year}' | >> more Info: <Double-Click> or <Enter>",
+        query.page_loader(db, "film_by_category_and_year", (category, year), results)
+    )
+    if movie:
+        display_film_record(db, root, movie)
+        # Insert actor search information into the "popular_query" database
+        db.insert_query_log('film_by_category_and_year', f'{category},{year}')
 
+
+@safe_ui_action
 def search_by_actor(db: DbMaster, root: tk.Tk) -> None:
     """
     Searches and displays films associated with a selected actor from the database.
@@ -165,7 +211,7 @@ def search_by_actor(db: DbMaster, root: tk.Tk) -> None:
 
     def get_films_by_actor(actor: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
-        Retrieves a list of films associated with the selected actor.
+        Retrieves the first page of films associated with the selected actor.
 
         Args:
             actor (Dict[str, Any]): Dictionary containing information about the selected actor.
@@ -174,7 +220,7 @@ def search_by_actor(db: DbMaster, root: tk.Tk) -> None:
             List[Dict[str, Any]]: List of films associated with the actor.
         """
         actor_id = actor.get('FID')
-        return query.get_info_from_db(db, "film_by_actor", (actor_id,))
+        return query.get_page_from_db(db, "film_by_actor", (actor_id,))
 
     # Retrieve the list of actors
     actor_list = query.get_info_from_db(db, "actor_list")
@@ -197,17 +243,19 @@ def search_by_actor(db: DbMaster, root: tk.Tk) -> None:
     # Allow the user to select a film from the list
     selected_film = gui.display_table(
         films,
-        f"Films by Actor: {actor.get('FirstName')} {actor.get('LastName')} | >> more Info: <Double-Click> or <Enter>"
+        f"Films by Actor: {actor.get('FirstName')} {actor.get('LastName')} | >> more Info: <Double-Click> or <Enter>",
+        query.page_loader(db, "film_by_actor", (actor.get('FID'),), films)
     )
     if not selected_film:
         display_error("No movie selected!")
         return
 
     # Display detailed information about the selected film
-    gui.display_record(root, selected_film)
+    display_film_record(db, root, selected_film)
     # Insert actor search information into the "popular_query" database
     db.insert_query_log('film_by_actor', f"{actor.get('FirstName')} {actor.get('LastName')}")
 
+@safe_ui_action
 def show_popular_queries(db: DbMaster) -> None:
     """
     Displays popular queries from the database in a table format. If the database table
@@ -227,6 +275,9 @@ def show_popular_queries(db: DbMaster) -> None:
     """
 
     try:
+        # Write pending log entries so the view is up to date
+        db.flush_log()
+
         # Check if table "popular_query" exists
         if not db.check_db_table("popular_query"):
             display_error("There are no entries in the 'Popular Queries' database yet!")
@@ -247,7 +298,8 @@ def show_popular_queries(db: DbMaster) -> None:
 
 def exit_program(db: DbMaster, root: tk.Tk) -> None:
     """
-    Closes the database connection (if it exists) and exits the Tkinter application.
+    Closes the database connection (if it exists), shuts down the connection pool
+    and exits the Tkinter application.
 
     Args:
         db (DbMaster): Database connection object, or None if no connection exists.
@@ -255,8 +307,27 @@ def exit_program(db: DbMaster, root: tk.Tk) -> None:
     """
     if db is not None:
         db.close()
+    close_pool()
     root.quit()
 
+def display_film_record(db: DbMaster, root: tk.Tk, film: Dict[str, Any]) -> None:
+    """
+    Displays the details of a film, including the explanation of its rating.
+
+    Result tables only hold the short film columns; the description and the actors are
+    fetched here for the selected film alone. The rating description is looked up here
+    instead of being computed by MySQL for every row of a film query.
+
+    Args:
+        db (DbMaster): Database connection object.
+        root (tk.Tk): Tkinter root window object.
+        film (Dict[str, Any]): The selected film row.
+    """
+    details = query.get_info_from_db(db, "film_detail_by_id", (film.get('fid'),))
+    record = dict(details[0].items()) if details else film
+    record['rating_description'] = RATING_DESCRIPTIONS.get(record.get('rating'), NOT_RATED)
+    gui.display_record(root, record)
+
 def display_error(message: str) -> None:
     """
     Displays an error message in a messagebox.